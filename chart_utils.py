@@ -1,13 +1,24 @@
 import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
 from plotly.subplots import make_subplots
-from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import logging
+import weakref
 from config import config_manager
-from utils import handle_errors
+from utils import handle_errors, PriceRingBuffer
 
 logger = logging.getLogger(__name__)
 
+# Figures are serialized to JSON on every st.plotly_chart call; orjson is much faster than stdlib json there
+try:
+    pio.json.config.default_engine = 'orjson'
+except ValueError:
+    logger.warning("orjson is not installed, falling back to the default plotly JSON engine")
+
+# Last price figure per bot and symbol, with the fingerprint it was drawn from; weak keys drop a bot's figures with its session
+_price_chart_memo = weakref.WeakKeyDictionary()
+
 class CustomChart:
     def __init__(self, title: str, x_title: str, y_title: str, chart_type: str):
         self.fig = go.Figure()
@@ -19,16 +30,24 @@ class CustomChart:
             title=title,
             xaxis_title=x_title,
             yaxis_title=y_title,
-            height=config_manager.get_config('chart_config')['height'],
-            width=config_manager.get_config('chart_config')['width'],
+            height=config_manager.chart_config.height,
+            width=config_manager.chart_config.width,
             legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01)
         )
 
-    def add_trace(self, x: List[Any], y: List[Any], name: str, mode: str = 'lines', color: str = None, symbol: str = None, size: int = None):
-        self.fig.add_trace(go.Scatter(
-            x=x, y=y, mode=mode, name=name,
+    @staticmethod
+    def build_trace(x: List[Any], y: List[Any], name: str, mode: str = 'lines', color: str = None, symbol: str = None, size: int = None) -> go.Scattergl:
+        return go.Scattergl(
+            x=x, y=np.asarray(y, dtype=np.float64), mode=mode, name=name,
             marker=dict(color=color, symbol=symbol, size=size)
-        ))
+        )
+
+    def add_trace(self, x: List[Any], y: List[Any], name: str, mode: str = 'lines', color: str = None, symbol: str = None, size: int = None):
+        self.fig.add_trace(self.build_trace(x, y, name, mode, color, symbol, size))
+
+    def add_traces(self, traces: List[go.Scattergl]):
+        # One add_traces call validates and relayouts the figure once instead of once per trace
+        self.fig.add_traces(traces)
 
     def show(self):
         self.fig.show()
@@ -36,7 +55,7 @@ class CustomChart:
     @handle_errors
     def save(self, filename: str):
         self.fig.write_image(filename)
-        logger.info(f"Chart saved as {filename}")
+        logger.info("Chart saved as %s", filename)
 
 class ChartCreator:
     def __init__(self, bot):
@@ -53,25 +72,42 @@ class ChartCreator:
         return {symbol: self.create_single_price_chart(symbol) for symbol in self.bot.symbol_allocations}
 
     def create_single_price_chart(self, symbol: str) -> go.Figure:
-        price_data = self.bot.price_history.get(symbol, [])
-        timestamps, prices = self.extract_price_data(price_data)
-        
+        timestamps, prices = self.extract_price_data(self.bot.price_history.get(symbol))
+        fingerprint = self.price_chart_fingerprint(symbol, timestamps, prices)
+        charts = _price_chart_memo.setdefault(self.bot, {})
+        cached = charts.get(symbol)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        fig = self.build_single_price_chart(symbol, timestamps, prices)
+        charts[symbol] = (fingerprint, fig)
+        return fig
+
+    def price_chart_fingerprint(self, symbol: str, timestamps: np.ndarray, prices: np.ndarray) -> Tuple[Any, ...]:
+        # Between price fetches nothing here changes, so the figure from the previous refresh is reused
+        last_sample = (timestamps[-1].item(), prices[-1].item()) if len(prices) else None
+        active_trade = self.get_active_trade(symbol)
+        buy_price = active_trade['buy_price'] if active_trade else None
+        return len(prices), last_sample, buy_price, self.bot.profit_margin
+
+    def build_single_price_chart(self, symbol: str, timestamps: np.ndarray, prices: np.ndarray) -> go.Figure:
         chart = CustomChart(f'{symbol} Price Chart', 'Timestamp', 'Price (USDT)', 'price')
-        chart.add_trace(timestamps, prices, f'{symbol} Price')
+        traces = [CustomChart.build_trace(timestamps, prices, f'{symbol} Price')]
         
-        buy_timestamps, buy_signals = self.get_buy_signals(symbol, price_data)
-        chart.add_trace(buy_timestamps, buy_signals, f'{symbol} Buy Signal', mode='markers', color='green', symbol='triangle-up', size=10)
+        buy_timestamps, buy_signals = self.get_buy_signals(symbol, timestamps, prices)
+        traces.append(CustomChart.build_trace(buy_timestamps, buy_signals, f'{symbol} Buy Signal', mode='markers', color='green', symbol='triangle-up', size=10))
         
-        sell_timestamps, sell_signals = self.get_sell_signals(symbol, price_data)
-        chart.add_trace(sell_timestamps, sell_signals, f'{symbol} Sell Signal', mode='markers', color='red', symbol='triangle-down', size=10)
+        sell_timestamps, sell_signals = self.get_sell_signals(symbol, timestamps, prices)
+        traces.append(CustomChart.build_trace(sell_timestamps, sell_signals, f'{symbol} Sell Signal', mode='markers', color='red', symbol='triangle-down', size=10))
         
         active_trade = self.get_active_trade(symbol)
         if active_trade:
             buy_price = active_trade['buy_price']
             target_sell_price = buy_price * (1 + self.bot.profit_margin)
-            chart.add_trace([timestamps[0], timestamps[-1]], [buy_price, buy_price], 'Buy Price', mode='lines', color='blue')
-            chart.add_trace([timestamps[0], timestamps[-1]], [target_sell_price, target_sell_price], 'Target Sell Price', mode='lines', color='red')
+            time_range = timestamps[[0, -1]]
+            traces.append(CustomChart.build_trace(time_range, [buy_price, buy_price], 'Buy Price', mode='lines', color='blue'))
+            traces.append(CustomChart.build_trace(time_range, [target_sell_price, target_sell_price], 'Target Sell Price', mode='lines', color='red'))
         
+        chart.add_traces(traces)
         return chart.fig
 
     def create_total_profit_chart(self) -> go.Figure:
@@ -84,27 +120,22 @@ class ChartCreator:
         return chart.fig
 
     @staticmethod
-    def extract_price_data(price_data: List[Dict[str, Any]]) -> Tuple[List[datetime], List[float]]:
-        return [entry['timestamp'] for entry in price_data], [entry['price'] for entry in price_data]
-
-    def get_buy_signals(self, symbol: str, price_data: List[Dict[str, Any]]) -> Tuple[List[datetime], List[float]]:
-        buy_signals = []
-        buy_timestamps = []
-        for entry in price_data:
-            if self.bot.should_buy(symbol, entry['price']) is not None:
-                buy_signals.append(entry['price'])
-                buy_timestamps.append(entry['timestamp'])
-        return buy_timestamps, buy_signals
-
-    def get_sell_signals(self, symbol: str, price_data: List[Dict[str, Any]]) -> Tuple[List[datetime], List[float]]:
-        sell_signals = []
-        sell_timestamps = []
-        for entry in price_data:
-            active_trade = self.get_active_trade(symbol)
-            if active_trade and entry['price'] >= active_trade['buy_price'] * (1 + self.bot.profit_margin):
-                sell_signals.append(entry['price'])
-                sell_timestamps.append(entry['timestamp'])
-        return sell_timestamps, sell_signals
+    def extract_price_data(price_data: Optional[PriceRingBuffer]) -> Tuple[np.ndarray, np.ndarray]:
+        if price_data is None:
+            return np.empty(0, dtype='datetime64[ns]'), np.empty(0, dtype=np.float64)
+        # Charts render on the script thread while the trading thread keeps appending
+        return price_data.snapshot(copy=True)
+
+    def get_buy_signals(self, symbol: str, timestamps: np.ndarray, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        buy_mask = self.bot.buy_signal_mask(prices)
+        return timestamps[buy_mask], prices[buy_mask]
+
+    def get_sell_signals(self, symbol: str, timestamps: np.ndarray, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        active_trade = self.get_active_trade(symbol)
+        if not active_trade:
+            return timestamps[:0], prices[:0]
+        sell_mask = prices >= active_trade['buy_price'] * (1 + self.bot.profit_margin)
+        return timestamps[sell_mask], prices[sell_mask]
 
     def get_active_trade(self, symbol: str) -> Optional[Dict[str, Any]]:
         return next((trade for trade in self.bot.active_trades.values() if trade['symbol'] == symbol), None)
@@ -115,4 +146,4 @@ class ChartCreator:
 @handle_errors
 def save_chart(fig: go.Figure, filename: str) -> None:
     fig.write_image(filename)
-    logger.info(f"Chart saved as {filename}")
+    logger.info("Chart saved as %s", filename)
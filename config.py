@@ -1,148 +1,424 @@
+import atexit
+import functools
+import hmac
 import logging
-from typing import Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Union
 import streamlit as st
+from kucoin.client import Market
+from cachetools import TTLCache
 from utils import KucoinClientManager
 from simulated_trade_client import SimulatedTradeClient
+from config_cache import file_cache
+from kucoin_rest import KucoinRestClient
+from price_feed import price_feed
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+logging.getLogger('kucoin').setLevel(logging.WARNING)
 
-DEFAULT_CONFIG = {
-    'trading_symbols': ['BTC-USDT', 'ETH-USDT', 'XRP-USDT', 'ADA-USDT', 'DOT-USDT'],
+# Shared by every price poll so per-symbol REST calls overlap without spawning threads each time
+kucoin_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='kucoin')
+
+# Read-only and shared by every ConfigManager; nested sections are proxies so a write can't leak across sessions
+DEFAULT_CONFIG = MappingProxyType({
+    'trading_symbols': ('BTC-USDT', 'ETH-USDT', 'XRP-USDT', 'ADA-USDT', 'DOT-USDT'),
     'profit_margin': 0.05,  # 5%
     'liquid_ratio': 0.5,  # 50%
-    'simulation_mode': {
+    'simulation_mode': MappingProxyType({
         'enabled': True,
         'initial_balance': 1000.0,
-    },
-    'chart_config': {
+    }),
+    'chart_config': MappingProxyType({
         'update_interval': 1,  # in seconds
         'history_length': 120,  # in minutes
         'height': 600,
         'width': 800,
-    },
-    'bot_config': {
+    }),
+    'bot_config': MappingProxyType({
         'update_interval': 1,  # in seconds
         'price_check_interval': 5,  # in seconds
-    },
-    'error_config': {
+    }),
+    'error_config': MappingProxyType({
         'max_retries': 3,
         'retry_delay': 5,  # in seconds
-    },
-    'fees': {
+    }),
+    'fees': MappingProxyType({
         'maker': 0.001,  # 0.1%
         'taker': 0.001,  # 0.1%
-    },
+    }),
     'max_total_orders': 10,
-    'currency_allocations': {},
-}
+    'currency_allocations': MappingProxyType({}),
+})
+
+def fresh_config() -> Dict[str, Any]:
+    # Only currency_allocations is mutated in place, so it is the only section that needs its own copy
+    config = dict(DEFAULT_CONFIG)
+    config['currency_allocations'] = {}
+    return config
+
+@dataclass(frozen=True, slots=True)
+class ApiCredentials:
+    api_key: str
+    api_secret: str
+    api_passphrase: str
+    live_trading_access_key: str
+
+@dataclass(frozen=True, slots=True)
+class Fees:
+    maker: float
+    taker: float
+
+    @classmethod
+    def from_config(cls, fees: Dict[str, float]) -> 'Fees':
+        return cls(maker=fees['maker'], taker=fees['taker'])
+
+@dataclass(frozen=True, slots=True)
+class SimulationMode:
+    enabled: bool
+    initial_balance: float
+
+    @classmethod
+    def from_config(cls, simulation_mode: Dict[str, Any]) -> 'SimulationMode':
+        return cls(enabled=simulation_mode['enabled'], initial_balance=simulation_mode['initial_balance'])
+
+@dataclass(frozen=True, slots=True)
+class ChartConfig:
+    update_interval: float
+    history_length: int
+    height: int
+    width: int
+
+    @classmethod
+    def from_config(cls, chart_config: Dict[str, Any]) -> 'ChartConfig':
+        return cls(
+            update_interval=chart_config['update_interval'],
+            history_length=chart_config['history_length'],
+            height=chart_config['height'],
+            width=chart_config['width'],
+        )
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    update_interval: float
+    price_check_interval: float
+
+    @classmethod
+    def from_config(cls, bot_config: Dict[str, Any]) -> 'BotConfig':
+        return cls(update_interval=bot_config['update_interval'], price_check_interval=bot_config['price_check_interval'])
+
+@dataclass(frozen=True, slots=True)
+class ErrorConfig:
+    max_retries: int
+    retry_delay: float
+
+    @classmethod
+    def from_config(cls, error_config: Dict[str, Any]) -> 'ErrorConfig':
+        return cls(max_retries=error_config['max_retries'], retry_delay=error_config['retry_delay'])
+
+@functools.lru_cache(maxsize=1)
+def get_api_credentials() -> ApiCredentials:
+    # Editing secrets.toml restarts the Streamlit server, so one read per process is enough
+    credentials = st.secrets["api_credentials"]
+    return ApiCredentials(
+        api_key=credentials["api_key"],
+        api_secret=credentials["api_secret"],
+        api_passphrase=credentials["api_passphrase"],
+        live_trading_access_key=credentials["live_trading_access_key"],
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_rest_client() -> KucoinRestClient:
+    # One HTTP/2 client per process so every REST call shares its connection pool
+    credentials = get_api_credentials()
+    client = KucoinRestClient(credentials.api_key, credentials.api_secret, credentials.api_passphrase)
+    atexit.register(client.close)
+    return client
+
+SYMBOLS_CACHE_TTL = 24 * 60 * 60  # in seconds
+KUCOIN_TIF_GTC = 'GTC'  # good-till-cancelled time in force
+BATCH_TICKER_THRESHOLD = 3  # from this many symbols one allTickers call beats per-symbol requests
+PRICE_CACHE_TTL = 0.5  # in seconds
+SYMBOL_LOOKUP_RETRY_DELAY = 60  # in seconds to skip symbol-increment lookups after a failed symbol fetch
+# Inclusive (low, high) bounds, matching the sidebar inputs; out-of-range values fall back to DEFAULT_CONFIG
+CONFIG_RANGES = MappingProxyType({
+    'liquid_ratio': (0.0, 1.0),
+    'profit_margin': (0.000001, 1.0),
+    'max_total_orders': (1, 50),
+})
+# Nested sections mirrored as slots dataclasses on ConfigManager; updating one through update_config rebuilds them
+CONFIG_SECTIONS = frozenset(('fees', 'simulation_mode', 'chart_config', 'bot_config', 'error_config'))
+
+def format_order_value(value: Union[Decimal, float, str], increment: Optional[str] = None, rounding: str = ROUND_HALF_EVEN) -> str:
+    # KuCoin rejects a price or size that is not a multiple of the symbol's increment
+    if increment is not None:
+        step = Decimal(increment)
+        return format((Decimal(str(value)) / step).to_integral_value(rounding) * step, 'f')
+    if isinstance(value, str):
+        return value
+    # Without the symbol's increments, 8 decimals at least avoids float repr artifacts like 0.30000000000000004
+    return f"{value:.8f}".rstrip('0').rstrip('.')
+
+def symbols_cache_key(api_url: str) -> str:
+    return f"symbol_increments:{api_url}"
+
+@st.cache_resource(ttl=SYMBOLS_CACHE_TTL, show_spinner=False)
+def usdt_symbol_increments(api_url: str) -> MappingProxyType:
+    # symbol -> (priceIncrement, baseIncrement); the symbol universe changes a few times a day at most,
+    # and entries are keyed on api_url so environments don't share them
+    cache_key = symbols_cache_key(api_url)
+    increments = file_cache.get(cache_key, ttl=SYMBOLS_CACHE_TTL)
+    if increments is None:
+        increments = {
+            symbol['symbol']: (symbol['priceIncrement'], symbol['baseIncrement']) for symbol in get_rest_client().get_symbols()
+            if symbol.get('quoteCurrency') == 'USDT' and symbol.get('enableTrading')
+        }
+        file_cache.set(cache_key, increments)
+    return MappingProxyType({symbol: tuple(steps) for symbol, steps in increments.items()})
+
+@st.cache_data(ttl=SYMBOLS_CACHE_TTL, show_spinner=False)
+def fetch_usdt_trading_symbols(api_url: str) -> Tuple[str, ...]:
+    return tuple(usdt_symbol_increments(api_url))
+
+@st.cache_resource(ttl=SYMBOLS_CACHE_TTL, show_spinner=False)
+def usdt_trading_symbol_set(api_url: str) -> frozenset:
+    # cache_resource hands back the same immutable set on every hit instead of an unpickled copy
+    return frozenset(fetch_usdt_trading_symbols(api_url))
+
+def invalidate_symbols_cache(api_url: str) -> None:
+    # Drops every cached layer so the next lookup refetches, e.g. right after KuCoin lists a new pair
+    fetch_usdt_trading_symbols.clear()
+    usdt_trading_symbol_set.clear()
+    usdt_symbol_increments.clear()
+    file_cache.delete(symbols_cache_key(api_url))
 
 class ConfigManager:
     def __init__(self):
         self.config = None
+        # The chart, bot and price-check pollers ask for overlapping symbols within the same instant
+        self._price_cache = TTLCache(maxsize=64, ttl=PRICE_CACHE_TTL)
+        self._price_cache_lock = threading.Lock()
+        self._price_fetches: Dict[frozenset, threading.Event] = {}
+        self._price_cache_stats = {'hits': 0, 'misses': 0}
+        self._symbol_lookup_retry_at = 0.0
         logger.info("Loading configuration")
         self.config = self.load_config()
+        self.load_config_sections()
+        # allTickers covers every market, so one parsed response serves all symbol sets until the next price check
+        self._all_tickers_cache = TTLCache(maxsize=1, ttl=self.bot_config.price_check_interval)
 
     def load_config(self) -> Dict[str, Any]:
         logger.info("Loading default configuration")
-        config = DEFAULT_CONFIG.copy()
+        config = fresh_config()
         try:
+            credentials = get_api_credentials()
             config.update({
-                'api_key': st.secrets["api_credentials"]["api_key"],
-                'api_secret': st.secrets["api_credentials"]["api_secret"],
-                'api_passphrase': st.secrets["api_credentials"]["api_passphrase"],
+                'api_key': credentials.api_key,
+                'api_secret': credentials.api_secret,
+                'api_passphrase': credentials.api_passphrase,
                 'api_url': 'https://api.kucoin.com',
-                'live_trading_access_key': st.secrets["api_credentials"]["live_trading_access_key"],
+                'live_trading_access_key': credentials.live_trading_access_key,
             })
         except KeyError as e:
-            logger.error(f"Missing API credential in Streamlit secrets: {e}")
+            logger.error("Missing API credential in Streamlit secrets: %s", e)
             raise
         return config
 
+    def load_config_sections(self) -> None:
+        # Fee getters and the trading loop's sleeps run on every tick; a slot read skips the nested dict lookups
+        self.fees = Fees.from_config(self.config['fees'])
+        self.simulation_mode = SimulationMode.from_config(self.config['simulation_mode'])
+        self.chart_config = ChartConfig.from_config(self.config['chart_config'])
+        self.bot_config = BotConfig.from_config(self.config['bot_config'])
+        self.error_config = ErrorConfig.from_config(self.config['error_config'])
+
     def save_config(self):
         # Implement saving configuration to a file
         pass
 
     def update_config(self, key: str, value: Any) -> None:
         self.config[key] = value
+        if key in CONFIG_RANGES:
+            self.validate_config()
+        if key in CONFIG_SECTIONS:
+            self.load_config_sections()
 
     def validate_config(self) -> None:
-        # Implement configuration validation
-        pass
+        for key, (low, high) in CONFIG_RANGES.items():
+            value = self.config.get(key)
+            if value is None or not low <= value <= high:
+                logger.warning("Config %s=%r is outside [%s, %s], using default %r", key, value, low, high, DEFAULT_CONFIG[key])
+                self.config[key] = DEFAULT_CONFIG[key]
 
     def validate_trading_symbols(self, symbols: list) -> list:
-        available_symbols = self.get_available_trading_symbols()
+        try:
+            available_symbols = usdt_trading_symbol_set(self.config['api_url'])
+        except Exception as e:
+            logger.error("Error fetching symbols: %s", e)
+            available_symbols = frozenset()
         valid_symbols = [symbol for symbol in symbols if symbol in available_symbols]
         if len(valid_symbols) != len(symbols):
-            logger.warning(f"Some trading symbols are not available: {set(symbols) - set(valid_symbols)}")
+            logger.warning("Some trading symbols are not available: %s", set(symbols) - available_symbols)
         return valid_symbols
 
-    def get_available_trading_symbols(self) -> list:
+    def get_available_trading_symbols(self) -> Tuple[str, ...]:
         try:
-            client = kucoin_client_manager.get_client()
-            symbols = client.get_symbols()
-            return [
-                symbol['symbol'] for symbol in symbols 
-                if (symbol.get('quoteCurrency') == 'USDT' and 
-                    symbol.get('enableTrading'))
-            ]
+            return fetch_usdt_trading_symbols(self.config['api_url'])
         except Exception as e:
-            logger.error(f"Error fetching symbols: {e}")
-            return []
+            logger.error("Error fetching symbols: %s", e)
+            return ()
+
+    def get_symbol_increments(self, symbol: str) -> Optional[Tuple[str, str]]:
+        # cache_resource keeps no failures, so without this every order would wait on the symbol fetch again
+        if time.monotonic() < self._symbol_lookup_retry_at:
+            return None
+        try:
+            return usdt_symbol_increments(self.config['api_url']).get(symbol)
+        except Exception as e:
+            logger.error("Error fetching symbol increments, retrying in %ss: %s", SYMBOL_LOOKUP_RETRY_DELAY, e)
+            self._symbol_lookup_retry_at = time.monotonic() + SYMBOL_LOOKUP_RETRY_DELAY
+            return None
+
+    def format_order(self, symbol: str, price: Union[Decimal, float, str], size: Union[Decimal, float, str]) -> Tuple[str, str]:
+        price_increment, size_increment = self.get_symbol_increments(symbol) or (None, None)
+        # The size is rounded down so an order never asks for more than the balance it was sized from
+        return format_order_value(price, price_increment), format_order_value(size, size_increment, ROUND_DOWN)
+
+    def refresh_trading_symbols(self) -> Tuple[str, ...]:
+        invalidate_symbols_cache(self.config['api_url'])
+        return self.get_available_trading_symbols()
 
     def fetch_real_time_prices(self, symbols: list) -> dict:
+        # Single-flight: concurrent callers for the same symbols wait on one fetch instead of each hitting the API
+        key = frozenset(symbols)
+        while True:
+            with self._price_cache_lock:
+                prices = self._price_cache.get(key)
+                if prices is not None:
+                    self._price_cache_stats['hits'] += 1
+                    return dict(prices)
+                in_flight = self._price_fetches.get(key)
+                if in_flight is None:
+                    self._price_cache_stats['misses'] += 1
+                    in_flight = self._price_fetches[key] = threading.Event()
+                    break
+            in_flight.wait()
+        try:
+            prices = self.fetch_uncached_prices(list(symbols))
+            with self._price_cache_lock:
+                self._price_cache[key] = prices
+            return dict(prices)
+        finally:
+            with self._price_cache_lock:
+                del self._price_fetches[key]
+            in_flight.set()
+
+    def get_price_cache_stats(self) -> Dict[str, int]:
+        with self._price_cache_lock:
+            return dict(self._price_cache_stats)
+
+    def fetch_uncached_prices(self, symbols: list) -> dict:
+        # Streamed prices come first; REST only covers symbols the feed hasn't priced recently (e.g. right after start-up)
+        price_feed.subscribe(symbols)
+        prices = price_feed.get_prices(symbols)
+        missing_symbols = [symbol for symbol in symbols if symbol not in prices]
+        if missing_symbols:
+            prices.update(self.fetch_rest_prices(missing_symbols))
+        return prices
+
+    def fetch_rest_prices(self, symbols: list) -> dict:
+        if len(symbols) >= BATCH_TICKER_THRESHOLD:
+            try:
+                return self.fetch_all_ticker_prices(symbols)
+            except Exception as e:
+                logger.error("Error fetching all tickers, falling back to per-symbol requests: %s", e)
+        return self.fetch_ticker_prices(symbols)
+
+    def fetch_all_ticker_prices(self, symbols: list) -> dict:
+        ticker_map = self.get_all_ticker_map()
+        return {symbol: ticker_map[symbol] for symbol in symbols if symbol in ticker_map}
+
+    def get_all_ticker_map(self) -> Dict[str, float]:
+        with self._price_cache_lock:
+            ticker_map = self._all_tickers_cache.get('all')
+        if ticker_map is None:
+            all_tickers = get_rest_client().get_all_tickers()
+            ticker_map = {
+                ticker['symbol']: float(ticker['last']) for ticker in all_tickers['ticker']
+                if ticker.get('last') is not None
+            }
+            with self._price_cache_lock:
+                self._all_tickers_cache['all'] = ticker_map
+        return ticker_map
+
+    def fetch_ticker_prices(self, symbols: list) -> dict:
         prices = {}
         try:
-            client = kucoin_client_manager.get_client()
-            for symbol in symbols:
-                ticker = client.get_ticker(symbol)
-                prices[symbol] = float(ticker['price'])
+            client = get_rest_client()
+            futures = {symbol: kucoin_executor.submit(client.get_ticker, symbol) for symbol in symbols}
         except Exception as e:
-            logger.error(f"Error fetching prices: {e}")
+            logger.error("Error fetching prices: %s", e)
+            return prices
+        for symbol, future in futures.items():
+            try:
+                prices[symbol] = float(future.result()['price'])
+            except Exception as e:
+                logger.error("Error fetching price for %s: %s", symbol, e)
         return prices
 
-    def place_spot_order(self, symbol: str, side: str, price: float, size: float, is_simulation: bool = False) -> Dict[str, Any]:
+    def place_spot_order(self, symbol: str, side: str, price: Union[Decimal, float, str], size: Union[Decimal, float, str], is_simulation: bool = False) -> Dict[str, Any]:
+        # Callers should pass Decimal (or pre-formatted strings) when exact precision matters
+        price, size = self.format_order(symbol, price, size)
         try:
             if is_simulation:
-                simulated_client = self.create_simulated_trade_client(
-                    self.config['fees'],
-                    self.config['max_total_orders'],
-                    self.config['currency_allocations']
-                )
-                order = simulated_client.create_limit_order(
+                order = self.get_simulated_trade_client().create_limit_order(
                     symbol=symbol,
                     side=side,
-                    price=str(price),
-                    size=str(size)
+                    price=price,
+                    size=size
                 )
             else:
-                client = kucoin_client_manager.get_client()
-                order = client.create_limit_order(
+                order = get_rest_client().create_limit_order(
                     symbol=symbol,
                     side=side,
-                    price=str(price),
-                    size=str(size),
-                    timeInForce=Client.TIMEINFORCE_GOOD_TILL_CANCELLED
+                    price=price,
+                    size=size,
+                    timeInForce=KUCOIN_TIF_GTC
                 )
             return order
         except Exception as e:
-            logger.error(f"Error placing order: {e}")
+            logger.error("Error placing order: %s", e)
             return {}
 
     def initialize_kucoin_client(self) -> None:
+        # Streamlit reruns call this on every script run; the shared manager already holds the clients
+        if kucoin_client_manager.get_client(Market) is not None:
+            return
         try:
+            credentials = get_api_credentials()
             kucoin_client_manager.initialize(
-                key=st.secrets["api_credentials"]["api_key"],
-                secret=st.secrets["api_credentials"]["api_secret"],
-                passphrase=st.secrets["api_credentials"]["api_passphrase"]
+                key=credentials.api_key,
+                secret=credentials.api_secret,
+                passphrase=credentials.api_passphrase
             )
-            self.client = kucoin_client_manager.get_client()
+            # Connect the ticker socket now so the first price poll doesn't wait on the handshake
+            price_feed.start()
         except KeyError as e:
-            logger.error(f"Missing API credential in Streamlit secrets: {e}")
+            logger.error("Missing API credential in Streamlit secrets: %s", e)
             raise
 
+    @property
+    def kucoin_client_manager(self) -> KucoinClientManager:
+        # The bot and wallet reach the process-wide clients through here instead of keeping their own
+        return kucoin_client_manager
+
     def verify_live_trading_access(self, input_key: str) -> bool:
-        return input_key == self.config['live_trading_access_key']
+        # Constant-time so response timing doesn't reveal how much of the key matched
+        return hmac.compare_digest((input_key or '').encode(), get_api_credentials().live_trading_access_key.encode())
 
     def get_config(self, key: str, default: Any = None) -> Any:
         return self.config.get(key, default)
@@ -153,24 +429,51 @@ class ConfigManager:
     def get_currency_allocations(self) -> Dict[str, float]:
         return self.config['currency_allocations']
 
+    def get_simulated_trade_client(self, max_total_orders: Optional[int] = None, currency_allocations: Optional[Dict[str, float]] = None) -> SimulatedTradeClient:
+        # This manager is shared by every session, so the client (and its order book) lives in the session's state.
+        # It is keyed on the settings' values and rebuilt only when one of them changes.
+        fees = self.config['fees']
+        if max_total_orders is None:
+            max_total_orders = self.config['max_total_orders']
+        if currency_allocations is None:
+            currency_allocations = self.config['currency_allocations']
+        key = (Fees.from_config(fees), max_total_orders, tuple(sorted(currency_allocations.items())))
+        cached = st.session_state.get('simulated_trade_client')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        client = self.create_simulated_trade_client(fees, max_total_orders, currency_allocations)
+        st.session_state['simulated_trade_client'] = (key, client)
+        return client
+
     def create_simulated_trade_client(self, fees: Dict[str, float], max_total_orders: int, currency_allocations: Dict[str, float]) -> SimulatedTradeClient:
         return SimulatedTradeClient(fees, max_total_orders, currency_allocations)
 
     def get_taker_fee(self) -> float:
-        return self.config['fees']['taker']
+        return self.fees.taker
 
     def get_maker_fee(self) -> float:
-        return self.config['fees']['maker']
+        return self.fees.maker
 
     def get_profit_margin(self) -> float:
         return self.config['profit_margin']
 
-config_manager = ConfigManager()
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    return ConfigManager()
+
+def __getattr__(name: str) -> Any:
+    # Build the shared ConfigManager (and read secrets) on first use rather than on import
+    if name == 'config_manager':
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 kucoin_client_manager = KucoinClientManager()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     logger.info("Running config.py as main script")
+    config_manager = get_config_manager()
     symbols = config_manager.get_available_trading_symbols()
-    logger.info(f"Available trading symbols: {symbols}")
+    logger.info("Available trading symbols: %s", symbols)
     prices = config_manager.fetch_real_time_prices(config_manager.config['trading_symbols'])
-    logger.info(f"Current prices: {prices}")
+    logger.info("Current prices: %s", prices)
@@ -0,0 +1,51 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'config')
+
+class FileCache:
+    """JSON files under ``cache_dir`` holding reference data that should survive app restarts."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.md5(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        try:
+            with open(self._path(key), 'rb') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            logger.info("File cache miss for %s", key)
+            return None
+        if time.time() - entry['ts'] >= ttl:
+            logger.info("File cache expired for %s", key)
+            return None
+        logger.info("File cache hit for %s", key)
+        return entry['data']
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w') as file:
+                json.dump({'ts': time.time(), 'data': value}, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write file cache for %s: %s", key, e)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+file_cache = FileCache()
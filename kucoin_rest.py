@@ -0,0 +1,105 @@
+import base64
+import hashlib
+import hmac
+import logging
+import time
+import uuid
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+KUCOIN_API_URL = 'https://api.kucoin.com'
+SUCCESS_CODE = '200000'
+# Same policy as the SDK's requests session (see KucoinClientManager.create_session)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.2  # in seconds, doubled on each retry
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+REQUEST_TIMEOUT = 5.0  # in seconds, the SDK's default
+
+class KucoinRestClient:
+    """Signed KuCoin REST calls over one shared HTTP/2 connection pool.
+
+    Requests issued concurrently from worker threads are multiplexed over the
+    same TLS connection instead of each holding a keep-alive socket.
+    """
+
+    def __init__(self, key: str, secret: str, passphrase: str, base_url: str = KUCOIN_API_URL):
+        self.key = key
+        self.secret = secret.encode('utf-8')
+        # Key version 2 expects the passphrase itself to be signed; it never changes, so sign it once
+        self.passphrase = self._sign(passphrase)
+        # Transport-level retries only cover failed connects, where nothing reached the exchange
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=16),
+            retries=RETRY_TOTAL,
+        )
+        self.http = httpx.Client(base_url=base_url, transport=transport, timeout=REQUEST_TIMEOUT)
+
+    def _sign(self, payload: str) -> str:
+        return base64.b64encode(hmac.new(self.secret, payload.encode('utf-8'), hashlib.sha256).digest()).decode()
+
+    def _auth_headers(self, method: str, path: str, body: str) -> Dict[str, str]:
+        timestamp = str(int(time.time() * 1000))
+        return {
+            'KC-API-SIGN': self._sign(timestamp + method + path + body),
+            'KC-API-TIMESTAMP': timestamp,
+            'KC-API-KEY': self.key,
+            'KC-API-PASSPHRASE': self.passphrase,
+            'KC-API-KEY-VERSION': '2',
+            'Content-Type': 'application/json',
+        }
+
+    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, auth: bool = False) -> Any:
+        body = ''
+        if method == 'GET' and params:
+            # The signature covers the exact query string that is sent
+            path += '?' + urlencode(sorted(params.items()))
+        elif params:
+            body = orjson.dumps(params).decode()
+        for attempt in range(RETRY_TOTAL + 1):
+            headers = self._auth_headers(method, path, body) if auth else None
+            response = self.http.request(method, path, content=body or None, headers=headers)
+            # Only GETs are retried on status, so an order is never sent twice
+            if method != 'GET' or response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+        # KuCoin explains 4xx rejections (insufficient balance, bad size, ...) in the body, so read it before the status
+        try:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response.raise_for_status()
+            raise
+        if not isinstance(payload, dict):
+            response.raise_for_status()
+            raise Exception(f"{response.status_code}-{response.text}")
+        if payload.get('code') != SUCCESS_CODE:
+            raise Exception(f"{response.status_code}-{payload.get('code')}: {payload.get('msg')}")
+        return payload.get('data')
+
+    def get_symbols(self) -> list:
+        return self._request('GET', '/api/v2/symbols')
+
+    def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        return self._request('GET', '/api/v1/market/orderbook/level1', {'symbol': symbol})
+
+    def get_all_tickers(self) -> Dict[str, Any]:
+        return self._request('GET', '/api/v1/market/allTickers')
+
+    def create_limit_order(self, symbol: str, side: str, size: str, price: str, clientOid: str = '', **kwargs) -> Dict[str, Any]:
+        params = {
+            'clientOid': clientOid or uuid.uuid4().hex,
+            'symbol': symbol,
+            'side': side,
+            'type': 'limit',
+            'size': size,
+            'price': price,
+            **kwargs,
+        }
+        return self._request('POST', '/api/v1/orders', params, auth=True)
+
+    def close(self) -> None:
+        self.http.close()
@@ -0,0 +1,124 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+from kucoin.client import WsToken
+from kucoin.ws_client import KucoinWsClient
+
+logger = logging.getLogger(__name__)
+
+TICKER_TOPIC = '/market/ticker:'
+MAX_PRICE_AGE = 10  # in seconds
+STALE_FEED_AFTER = 60  # in seconds without a ticker message before a subscribed feed is restarted
+
+class PriceFeed:
+    """Latest ticker prices pushed by KuCoin's public WebSocket feed.
+
+    The socket runs on its own event loop in a daemon thread; readers only take
+    a snapshot of the price dict, so a price lookup never touches the network.
+    The SDK reports no connection failures, so a feed that stops delivering
+    ticker messages is torn down and started again on the next poll.
+    """
+
+    def __init__(self, max_price_age: float = MAX_PRICE_AGE):
+        self.max_price_age = max_price_age
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._subscribed = set()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._ws_client = None
+        self._ready = threading.Event()
+        self._last_message = 0.0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = self._loop = asyncio.new_event_loop()
+            self._ready.clear()
+            self._last_message = time.monotonic()
+        threading.Thread(target=self._run, args=(loop,), name='price-feed', daemon=True).start()
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._connect(loop))
+        loop.run_forever()
+        # Only reached once _restart_if_stale has stopped this loop
+        loop.close()
+
+    async def _connect(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            ws_client = await KucoinWsClient.create(loop, WsToken(), self._handle_message, private=False)
+        except Exception as e:
+            # Left to the stale-feed check, which restarts the feed once STALE_FEED_AFTER has passed
+            logger.error("Failed to start KuCoin price feed: %s", e)
+            return
+        with self._lock:
+            # A restart may have replaced this loop while the client was being created
+            if self._loop is loop:
+                self._ws_client = ws_client
+                self._ready.set()
+                logger.info("KuCoin price feed started")
+
+    def _restart_if_stale(self) -> None:
+        with self._lock:
+            loop = self._loop
+            if loop is None or not self._subscribed or time.monotonic() - self._last_message < STALE_FEED_AFTER:
+                return
+            self._loop = None
+            self._ws_client = None
+            self._subscribed = set()
+            self._ready.clear()
+        logger.warning("No KuCoin ticker messages for %ss, restarting the price feed", STALE_FEED_AFTER)
+        loop.call_soon_threadsafe(loop.stop)
+        self.start()
+
+    async def _handle_message(self, msg: dict) -> None:
+        topic = msg.get('topic', '')
+        if not topic.startswith(TICKER_TOPIC):
+            return
+        price = msg['data'].get('price')
+        now = time.monotonic()
+        with self._lock:
+            self._last_message = now
+            if price is not None:
+                self._prices[topic[len(TICKER_TOPIC):]] = (float(price), now)
+
+    def subscribe(self, symbols: List[str]) -> None:
+        self._restart_if_stale()
+        if self._subscribed.issuperset(symbols):
+            return
+        self.start()
+        # Never hold up a price poll on the handshake; REST covers these symbols until the socket is up
+        if not self._ready.is_set():
+            return
+        with self._lock:
+            ws_client, loop = self._ws_client, self._loop
+            if ws_client is None:
+                return
+            new_symbols = frozenset(symbols) - self._subscribed
+            # Handed to the SDK exactly once: it keeps the topic and re-sends it on every (re)connect,
+            # so asking again would only add duplicate copies to its list
+            self._subscribed |= new_symbols
+        if not new_symbols:
+            return
+        topic = TICKER_TOPIC + ','.join(sorted(new_symbols))
+        future = asyncio.run_coroutine_threadsafe(ws_client.subscribe(topic), loop)
+        future.add_done_callback(functools.partial(self._subscribe_done, new_symbols))
+
+    @staticmethod
+    def _subscribe_done(symbols: frozenset, future: concurrent.futures.Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.warning("Subscribing to prices for %s failed, waiting for the feed to reconnect: %s", sorted(symbols), future.exception())
+
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        oldest = time.monotonic() - self.max_price_age
+        with self._lock:
+            entries = [(symbol, self._prices.get(symbol)) for symbol in symbols]
+        return {symbol: entry[0] for symbol, entry in entries if entry is not None and entry[1] >= oldest}
+
+price_feed = PriceFeed()
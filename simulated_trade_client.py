@@ -1,27 +1,63 @@
+import itertools
 import time
-import uuid
 import logging
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 from kucoin.client import Trade
 
 logger = logging.getLogger(__name__)
 
+# Timestamps repeat for orders placed within the same millisecond and uuid4 costs an os.urandom call; a counter does neither
+_order_seq = itertools.count()
+
+# Fields every simulated order shares, filled in once instead of per call
+ORDER_TEMPLATE = MappingProxyType({
+    'opType': 'DEAL',
+    'type': 'limit',
+    'status': 'done',
+    'channel': 'API',
+    'isActive': True,
+    'cancelExist': False,
+    'tradeType': 'TRADE',
+})
+ORDER_OPTION_DEFAULTS = MappingProxyType({
+    'timeInForce': 'GTC',
+    'postOnly': False,
+    'hidden': False,
+    'iceberg': False,
+    'visibleSize': '0',
+    'cancelAfter': 0,
+    'remark': None,
+    'tags': None,
+})
+
 class SimulatedTradeClient:
     def __init__(self, fees: Dict[str, float], max_total_orders: int, currency_allocations: Dict[str, float]):
         self.orders = {}
+        # Order ids per symbol, in creation order, so symbol queries skip unrelated orders
+        self._order_ids_by_symbol: Dict[str, List[str]] = {}
+        # Fills of orders still marked done, keyed by order id in creation order
+        self._fills: Dict[str, Dict[str, Any]] = {}
         self.MAKER_FEE = fees.get('maker', 0.001)  # Default 0.1%
         self.TAKER_FEE = fees.get('taker', 0.001)  # Default 0.1%
+        self._taker_fee_rate = str(self.TAKER_FEE)
         self.max_total_orders = max_total_orders
         self.currency_allocations = currency_allocations
 
-    def create_limit_order(self, symbol: str, side: str, price: str, size: str, **kwargs) -> Dict[str, Any]:
+    def create_limit_order(self, symbol: str, side: str, price: str, size: str, timestamp: Optional[int] = None, **kwargs) -> Dict[str, Any]:
         if len(self.orders) >= self.max_total_orders:
-            logger.warning(f"Maximum total orders ({self.max_total_orders}) reached")
+            logger.warning("Maximum total orders (%s) reached", self.max_total_orders)
             return {}
 
-        order_id = str(uuid.uuid4())
-        timestamp = int(time.time() * 1000)
-        price = float(price)
+        seq = next(_order_seq)
+        order_id = f'simulated-{seq}'
+        # Historical replays pass the bar's time in milliseconds; live simulation stamps the wall clock
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000
+        # Keep the caller's price string for the order record instead of re-stringifying the float
+        price_str = str(price)
+        price = float(price_str)
+        client_oid = kwargs.get('clientOid') or f'simulated_{side}_{symbol}_{seq}'
         size = float(size)
         
         if side == Trade.SIDE_BUY:
@@ -31,82 +67,47 @@ class SimulatedTradeClient:
             fee_usdt = amount_usdt * self.TAKER_FEE
             # Calculate actual crypto amount received after fees
             actual_crypto_amount = (amount_usdt - fee_usdt) / price
-            
-            order = {
-                'orderId': order_id,
-                'symbol': symbol,
-                'opType': 'DEAL',
-                'type': Trade.ORDER_LIMIT,
-                'side': side,
-                'price': str(price),
-                'size': str(actual_crypto_amount),
-                'funds': str(amount_usdt),
-                'dealFunds': str(amount_usdt),
-                'dealSize': str(actual_crypto_amount),
-                'fee': str(fee_usdt),
-                'feeCurrency': symbol.split('-')[1],
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'status': 'done',
-                'timeInForce': kwargs.get('timeInForce', Trade.TIMEINFORCE_GOOD_TILL_CANCELLED),
-                'postOnly': kwargs.get('postOnly', False),
-                'hidden': kwargs.get('hidden', False),
-                'iceberg': kwargs.get('iceberg', False),
-                'visibleSize': kwargs.get('visibleSize', '0'),
-                'cancelAfter': kwargs.get('cancelAfter', 0),
-                'channel': 'API',
-                'clientOid': kwargs.get('clientOid', f'simulated_{side}_{symbol}_{timestamp}'),
-                'remark': kwargs.get('remark', None),
-                'tags': kwargs.get('tags', None),
-                'isActive': True,
-                'cancelExist': False,
-                'tradeType': 'TRADE'
-            }
-            
-            logger.info(f"Created simulated buy order: {actual_crypto_amount:.8f} {symbol} "
-                       f"at {price:.4f} USDT (Fee: {fee_usdt:.8f} USDT)")
-            
+            deal_size = str(actual_crypto_amount)
+            funds = str(amount_usdt)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Created simulated buy order: %.8f %s at %.4f USDT (Fee: %.8f USDT)",
+                            actual_crypto_amount, symbol, price, fee_usdt)
         else:  # sell
             amount_crypto = size
             amount_usdt = amount_crypto * price
             fee_usdt = amount_usdt * self.TAKER_FEE
             actual_usdt_received = amount_usdt - fee_usdt
-            
-            order = {
-                'orderId': order_id,
-                'symbol': symbol,
-                'opType': 'DEAL',
-                'type': Trade.ORDER_LIMIT,
-                'side': side,
-                'price': str(price),
-                'size': str(amount_crypto),
-                'funds': str(actual_usdt_received),
-                'dealFunds': str(amount_usdt),
-                'dealSize': str(amount_crypto),
-                'fee': str(fee_usdt),
-                'feeCurrency': symbol.split('-')[1],
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'status': 'done',
-                'timeInForce': kwargs.get('timeInForce', Trade.TIMEINFORCE_GOOD_TILL_CANCELLED),
-                'postOnly': kwargs.get('postOnly', False),
-                'hidden': kwargs.get('hidden', False),
-                'iceberg': kwargs.get('iceberg', False),
-                'visibleSize': kwargs.get('visibleSize', '0'),
-                'cancelAfter': kwargs.get('cancelAfter', 0),
-                'channel': 'API',
-                'clientOid': kwargs.get('clientOid', f'simulated_{side}_{symbol}_{timestamp}'),
-                'remark': kwargs.get('remark', None),
-                'tags': kwargs.get('tags', None),
-                'isActive': True,
-                'cancelExist': False,
-                'tradeType': 'TRADE'
-            }
-            
-            logger.info(f"Created simulated sell order: {amount_crypto:.8f} {symbol} "
-                       f"at {price:.4f} USDT (Fee: {fee_usdt:.8f} USDT)")
-        
+            deal_size = str(amount_crypto)
+            funds = str(actual_usdt_received)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Created simulated sell order: %.8f %s at %.4f USDT (Fee: %.8f USDT)",
+                            amount_crypto, symbol, price, fee_usdt)
+
+        # Only recognised order options override the defaults; most calls pass none at all
+        options = ORDER_OPTION_DEFAULTS
+        if kwargs:
+            options = {**options, **{key: value for key, value in kwargs.items() if key in ORDER_OPTION_DEFAULTS}}
+        order = {
+            **ORDER_TEMPLATE,
+            **options,
+            'orderId': order_id,
+            'symbol': symbol,
+            'side': side,
+            'price': price_str,
+            'size': deal_size,
+            'funds': funds,
+            'dealFunds': str(amount_usdt),
+            'dealSize': deal_size,
+            'fee': str(fee_usdt),
+            'feeCurrency': symbol.partition('-')[2],
+            'createdAt': timestamp,
+            'updatedAt': timestamp,
+            'clientOid': client_oid,
+        }
+
         self.orders[order_id] = order
+        self._order_ids_by_symbol.setdefault(symbol, []).append(order_id)
+        self._record_fill(order)
         return {'orderId': order_id}
 
     def get_order(self, order_id: str) -> Dict[str, Any]:
@@ -116,45 +117,51 @@ class SimulatedTradeClient:
         if order_id in self.orders:
             self.orders[order_id]['status'] = 'cancelled'
             self.orders[order_id]['isActive'] = False
-            logger.info(f"Cancelled order: {order_id}")
+            self._fills.pop(order_id, None)
+            logger.info("Cancelled order: %s", order_id)
             return {'cancelledOrderIds': [order_id]}
         return {'cancelledOrderIds': []}
 
     def get_fills(self, trade_type: str = 'TRADE', order_id: str = None) -> List[Dict[str, Any]]:
-        fills = []
-        for order in self.orders.values():
-            if order['status'] == 'done':
-                if order_id is None or order['orderId'] == order_id:
-                    fills.append({
-                        'symbol': order['symbol'],
-                        'tradeId': str(uuid.uuid4()),
-                        'orderId': order['orderId'],
-                        'counterOrderId': str(uuid.uuid4()),
-                        'side': order['side'],
-                        'liquidity': 'taker',
-                        'forceTaker': True,
-                        'price': order['price'],
-                        'size': order['dealSize'],
-                        'funds': order['dealFunds'],
-                        'fee': order['fee'],
-                        'feeRate': str(self.TAKER_FEE),
-                        'feeCurrency': order['feeCurrency'],
-                        'stop': '',
-                        'type': 'limit',
-                        'createdAt': order['createdAt'],
-                        'tradeType': 'TRADE'
-                    })
-        return fills
+        if order_id is None:
+            return list(self._fills.values())
+        fill = self._fills.get(order_id)
+        return [fill] if fill is not None else []
+
+    def _record_fill(self, order: Dict[str, Any]) -> None:
+        # Each simulated order fills exactly once, so the fill is built at creation with ids derived from the order id
+        order_id = order['orderId']
+        self._fills[order_id] = {
+            'symbol': order['symbol'],
+            'tradeId': f"{order_id}-trade",
+            'orderId': order_id,
+            'counterOrderId': f"{order_id}-counter",
+            'side': order['side'],
+            'liquidity': 'taker',
+            'forceTaker': True,
+            'price': order['price'],
+            'size': order['dealSize'],
+            'funds': order['dealFunds'],
+            'fee': order['fee'],
+            'feeRate': self._taker_fee_rate,
+            'feeCurrency': order['feeCurrency'],
+            'stop': '',
+            'type': 'limit',
+            'createdAt': order['createdAt'],
+            'tradeType': 'TRADE'
+        }
 
     def get_orders(self, symbol: str = None, status: str = None) -> List[Dict[str, Any]]:
-        orders = []
-        for order in self.orders.values():
-            if (symbol is None or order['symbol'] == symbol) and \
-               (status is None or 
-                (status == 'active' and order['isActive']) or 
-                (status == 'done' and not order['isActive'])):
-                orders.append(order)
-        return orders
+        if symbol is None:
+            candidates = self.orders.values()
+        else:
+            candidates = [self.orders[order_id] for order_id in self._order_ids_by_symbol.get(symbol, ())]
+        if status is None:
+            return list(candidates)
+        return [
+            order for order in candidates
+            if (status == 'active' and order['isActive']) or (status == 'done' and not order['isActive'])
+        ]
 
 def create_simulated_trade_client(fees: Dict[str, float], max_total_orders: int, currency_allocations: Dict[str, float]) -> SimulatedTradeClient:
     return SimulatedTradeClient(fees, max_total_orders, currency_allocations)
@@ -8,8 +8,9 @@ from chart_utils import ChartCreator
 from trading_loop import initialize_trading_loop, stop_trading_loop
 from ui_components import UIManager
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Set up logging once; Streamlit re-executes this script on every rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def initialize_bot(is_simulation: bool, liquid_ratio: float, initial_balance: float) -> TradingBot:
@@ -17,7 +18,7 @@ def initialize_bot(is_simulation: bool, liquid_ratio: float, initial_balance: fl
     bot = st.session_state.get('bot')
     if bot is None:
         logger.info("Creating a new bot instance.")
-        bot = TradingBot(config_manager.get_config('bot_config')['update_interval'], liquid_ratio)
+        bot = TradingBot(config_manager.bot_config.update_interval, liquid_ratio)
         st.session_state['bot'] = bot
     else:
         logger.info("Using existing bot instance.")
@@ -28,6 +29,23 @@ def initialize_bot(is_simulation: bool, liquid_ratio: float, initial_balance: fl
     logger.info("Bot initialized successfully.")
     return bot
 
+def render_trading_view(ui_manager: UIManager) -> None:
+    bot = st.session_state['bot']
+    user_selected_symbols = st.session_state.user_inputs['user_selected_symbols']
+
+    st.subheader("Trading Status")
+    current_prices = config_manager.fetch_real_time_prices(user_selected_symbols)
+    current_status = bot.get_current_status(current_prices)
+    ui_manager.display_component('status_table', current_status=current_status)
+
+    st.subheader("Trade Messages")
+    ui_manager.display_component('trade_messages')
+
+    st.subheader("Trading Charts")
+    chart_creator = ChartCreator(bot)
+    charts = chart_creator.create_charts()
+    ui_manager.display_component('chart_display', charts=charts)
+
 def main():
     logger.info("Starting main function...")
     st.set_page_config(layout="wide")
@@ -38,7 +56,7 @@ def main():
 
     try:
         logger.info("Initializing KuCoin client...")
-        if not config_manager.get_config('simulation_mode')['enabled']:
+        if not config_manager.simulation_mode.enabled:
             config_manager.initialize_kucoin_client()
         logger.info("Initializing session state...")
         ui_manager.initialize()
@@ -121,18 +139,9 @@ def main():
 
         # Main area
         if st.session_state.is_trading:
-            st.subheader("Trading Status")
-            current_prices = config_manager.fetch_real_time_prices(user_selected_symbols)
-            current_status = bot.get_current_status(current_prices)
-            ui_manager.display_component('status_table', current_status=current_status)
-
-            st.subheader("Trade Messages")
-            ui_manager.display_component('trade_messages')
-
-            st.subheader("Trading Charts")
-            chart_creator = ChartCreator(bot)
-            charts = chart_creator.create_charts()
-            ui_manager.display_component('chart_display', charts=charts)
+            # Only this fragment re-runs on the chart interval; the sidebar and controls are not rebuilt each tick
+            refresh_interval = config_manager.chart_config.update_interval
+            st.fragment(render_trading_view, run_every=refresh_interval)(ui_manager)
         else:
             st.info("Click 'Start Trading' to begin trading.")
 
@@ -140,7 +149,7 @@ def main():
         ui_manager.display_component('simulation_indicator', is_simulation=is_simulation)
 
     except Exception as e:
-        logger.error(f"An error occurred in the main function: {e}")
+        logger.error("An error occurred in the main function: %s", e)
         ui_manager.display_component('error_message', error_message=str(e), container=error_container)
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import logging
 from datetime import datetime
-from collections import deque
-from statistics import mean, stdev
+from decimal import Decimal
 from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 from wallet import create_wallet
 from config import config_manager
-from utils import handle_trading_errors
+from utils import handle_trading_errors, PriceRingBuffer
 from kucoin.client import Trade
 from simulated_trade_client import SimulatedTradeClient
 
@@ -17,7 +17,7 @@ class TradingBot:
         self.update_interval = update_interval
         self.liquid_ratio = liquid_ratio
         self.symbol_allocations: Dict[str, float] = {}
-        self.price_history: Dict[str, deque] = {}
+        self.price_history: Dict[str, PriceRingBuffer] = {}
         self.active_trades: Dict[str, Dict] = {}
         self.total_trades: int = 0
         self.status_history: List[Dict] = []
@@ -33,10 +33,10 @@ class TradingBot:
         self.profit_margin: float = config_manager.get_profit_margin()
 
     def initialize(self) -> None:
-        self.is_simulation = config_manager.get_config('simulation_mode')['enabled']
-        self.PRICE_HISTORY_LENGTH = config_manager.get_config('chart_config')['history_length']
+        self.is_simulation = config_manager.simulation_mode.enabled
+        self.PRICE_HISTORY_LENGTH = config_manager.chart_config.history_length
         self.wallet = create_wallet(self.is_simulation, self.liquid_ratio)
-        initial_balance = config_manager.get_config('simulation_mode')['initial_balance']
+        initial_balance = config_manager.simulation_mode.initial_balance
         self.wallet.initialize_balance(initial_balance)
         self.wallet.set_currency_allocations(self.currency_allocations)
         
@@ -44,11 +44,7 @@ class TradingBot:
             self.trade_client = config_manager.kucoin_client_manager.get_client()
             self.update_wallet_balances()
         else:
-            self.trade_client = config_manager.create_simulated_trade_client(
-                config_manager.get_config('fees'),
-                self.max_total_orders,
-                self.currency_allocations
-            )
+            self.trade_client = config_manager.get_simulated_trade_client(self.max_total_orders, self.currency_allocations)
         
         logger.info("Bot initialized successfully.")
         
@@ -56,9 +52,11 @@ class TradingBot:
     def update_wallet_balances(self) -> None:
         try:
             self.wallet.sync_with_exchange('trading')
-            logger.info(f"Updated wallet balances: {self.wallet.get_account_summary()}")
+            # Building the account summary walks every currency; skip it when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updated wallet balances: %s", self.wallet.get_account_summary())
         except Exception as e:
-            logger.error(f"Error updating wallet balances: {e}")
+            logger.error("Error updating wallet balances: %s", e)
 
     def get_balance(self, currency: str, balance_type: str) -> float:
         return self.wallet.get_balance('trading', currency, balance_type)
@@ -75,27 +73,57 @@ class TradingBot:
     def update_price_history(self, symbols: List[str], prices: Dict[str, float]) -> None:
         for symbol in symbols:
             if symbol not in self.price_history:
-                self.price_history[symbol] = deque(maxlen=self.PRICE_HISTORY_LENGTH)
+                self.price_history[symbol] = PriceRingBuffer(self.PRICE_HISTORY_LENGTH)
             if prices[symbol] is not None:
-                self.price_history[symbol].append({
-                    'timestamp': datetime.now(),
-                    'price': prices[symbol]
-                })
+                self.price_history[symbol].append(datetime.now(), prices[symbol])
                 self.wallet.update_currency_price('trading', symbol, prices[symbol])
 
+    def get_price_band(self, symbol: str) -> Optional[Tuple[float, float]]:
+        # Reads a live view of the history, so only the trading thread (the buffer's writer) may call this
+        history = self.price_history.get(symbol)
+        if history is None:
+            return None
+        return self.price_band(history.prices())
+
+    def price_band(self, prices: np.ndarray) -> Optional[Tuple[float, float]]:
+        if len(prices) < self.PRICE_HISTORY_LENGTH:
+            return None
+        price_mean = prices.mean()
+        price_stdev = prices.std(ddof=1) if prices.min() != prices.max() else 0
+        return price_mean, price_stdev
+
     def should_buy(self, symbol: str, current_price: float) -> Optional[float]:
-        if current_price is None or len(self.price_history[symbol]) < self.PRICE_HISTORY_LENGTH:
+        if current_price is None:
             return None
-        
-        prices = [entry['price'] for entry in self.price_history[symbol]]
-        price_mean = mean(prices)
-        price_stdev = stdev(prices) if len(set(prices)) > 1 else 0
+        band = self.get_price_band(symbol)
+        if band is None:
+            return None
+        price_mean, price_stdev = band
         
         if current_price < price_mean and (price_mean - current_price) < price_stdev:
             return current_price
         
         return None
 
+    def buy_signal_mask(self, prices: np.ndarray) -> np.ndarray:
+        # Same rule as should_buy over a copied history window; the band comes from that copy, so a
+        # reader on another thread never touches the live buffer, and it is computed once for the whole array
+        band = self.price_band(prices)
+        if band is None:
+            return np.zeros(len(prices), dtype=bool)
+        price_mean, price_stdev = band
+        return (prices < price_mean) & ((price_mean - prices) < price_stdev)
+
+    def sell_ready_trades(self, prices: Dict[str, float]) -> List[Tuple[str, Dict]]:
+        # One comparison over every active trade instead of rescanning active_trades once per symbol
+        trades = [(order_id, trade) for order_id, trade in self.active_trades.items() if prices.get(trade['symbol']) is not None]
+        if not trades:
+            return []
+        current_prices = np.array([prices[trade['symbol']] for _, trade in trades], dtype=np.float64)
+        buy_prices = np.array([trade['buy_price'] for _, trade in trades], dtype=np.float64)
+        sell_mask = current_prices >= self.calculate_target_sell_price(buy_prices)
+        return [trades[i] for i in np.flatnonzero(sell_mask)]
+
     def can_place_order(self, symbol: str) -> bool:
         total_orders = sum(len(orders) for orders in self.active_orders.values())
         return total_orders < self.max_total_orders
@@ -114,18 +142,22 @@ class TradingBot:
         try:
             # Adjust the buy amount considering the taker fee
             buy_amount_with_fee = amount_usdt / (1 + self.taker_fee)
+            price, size = config_manager.format_order(symbol, limit_price, buy_amount_with_fee / limit_price)
+            if Decimal(size) <= 0:
+                logger.warning("Buy size for %s rounds down to zero, skipping order", symbol)
+                return None
             
             order = self.trade_client.create_limit_order(
                 symbol=symbol,
                 side=Trade.SIDE_BUY,
-                price=str(limit_price),
-                size=str(buy_amount_with_fee / limit_price),
+                price=price,
+                size=size,
             )
             if order:
-                self._process_order_response(order, 'buy', symbol, buy_amount_with_fee / limit_price, limit_price)
+                self._process_order_response(order, 'buy', symbol, size, price)
             return order
         except Exception as e:
-            logger.error(f"Error placing buy order: {e}")
+            logger.error("Error placing buy order: %s", e)
             return None
 
     @handle_trading_errors
@@ -134,17 +166,22 @@ class TradingBot:
             return None
         
         try:
+            price, size = config_manager.format_order(symbol, target_sell_price, amount_crypto)
+            if Decimal(size) <= 0:
+                logger.warning("Sell size for %s rounds down to zero, skipping order", symbol)
+                return None
+            
             order = self.trade_client.create_limit_order(
                 symbol=symbol,
                 side=Trade.SIDE_SELL,
-                price=str(target_sell_price),
-                size=str(amount_crypto),
+                price=price,
+                size=size,
             )
             if order:
-                self._process_order_response(order, 'sell', symbol, amount_crypto, target_sell_price)
+                self._process_order_response(order, 'sell', symbol, size, price)
             return order
         except Exception as e:
-            logger.error(f"Error placing sell order: {e}")
+            logger.error("Error placing sell order: %s", e)
             return None
 
     def _process_order_response(self, order: Dict, side: str, symbol: str, amount: float, price: float) -> None:
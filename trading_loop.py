@@ -1,4 +1,3 @@
-import time
 import threading
 import streamlit as st
 from typing import List, Tuple, Dict, Any
@@ -23,10 +22,11 @@ class TradingLoop:
         while not stop_event.is_set():
             try:
                 self.trading_iteration()
-                time.sleep(config_manager.get_config('bot_config')['update_interval'])
+                # Waiting on the event instead of sleeping lets stop_trading_loop end the loop immediately
+                stop_event.wait(config_manager.bot_config.update_interval)
             except Exception as e:
-                logger.error(f"An error occurred in the trading loop: {str(e)}")
-                time.sleep(config_manager.get_config('error_config')['retry_delay'])
+                logger.error("An error occurred in the trading loop: %s", e)
+                stop_event.wait(config_manager.error_config.retry_delay)
 
     @handle_trading_errors
     def trading_iteration(self) -> None:
@@ -37,9 +37,10 @@ class TradingLoop:
                 if current_prices.get(symbol) is not None:
                     self.process_symbol(symbol, current_prices[symbol])
 
+            self.check_sell_conditions(current_prices)
             self.update_bot_status(current_prices)
         except Exception as e:
-            logger.error(f"Error in trading iteration: {e}")
+            logger.error("Error in trading iteration: %s", e)
 
     @handle_trading_errors
     def process_symbol(self, symbol: str, current_price: float) -> None:
@@ -50,11 +51,9 @@ class TradingLoop:
             # Process orders if possible
             if self.bot.can_place_order(symbol):
                 self.check_buy_condition(symbol, current_price)
-            
-            self.check_sell_condition(symbol, current_price)
 
         except Exception as e:
-            logger.error(f"Error processing symbol {symbol}: {e}")
+            logger.error("Error processing symbol %s: %s", symbol, e)
 
     @handle_trading_errors
     def check_buy_condition(self, symbol: str, current_price: float) -> None:
@@ -69,36 +68,28 @@ class TradingLoop:
                     if max_order_amount > 0:
                         order = self.bot.place_buy_order(symbol, max_order_amount, should_buy)
                         if order:
-                            logger.info(
-                                f"Buy order placed for {symbol}: {order['dealSize']} at {should_buy} USDT "
-                                f"(Fee: {order['fee']} USDT)"
-                            )
+                            logger.info("Buy order placed for %s: %s at %s USDT (Fee: %s USDT)",
+                                        symbol, order['dealSize'], should_buy, order['fee'])
         except Exception as e:
-            logger.error(f"Error checking buy condition for {symbol}: {e}")
+            logger.error("Error checking buy condition for %s: %s", symbol, e)
 
     @handle_trading_errors
-    def check_sell_condition(self, symbol: str, current_price: float) -> None:
+    def check_sell_conditions(self, current_prices: Dict[str, float]) -> None:
         try:
-            active_trades = [trade for trade in self.bot.active_trades.values() if trade['symbol'] == symbol]
-            
-            for trade in active_trades:
-                target_sell_price = self.bot.calculate_target_sell_price(trade['buy_price'])
+            for order_id, trade in self.bot.sell_ready_trades(current_prices):
+                symbol = trade['symbol']
+                current_price = current_prices[symbol]
+                sell_order = self.bot.place_sell_order(symbol, trade['amount'], current_price)
                 
-                if current_price >= target_sell_price:
-                    sell_amount = trade['amount']
-                    sell_order = self.bot.place_sell_order(symbol, sell_amount, current_price)
-                    
-                    if sell_order:
-                        profit = self.bot.calculate_profit(trade, sell_order)
-                        self.bot.update_profit(symbol, profit)
-                        logger.info(
-                            f"Sell order executed for {symbol}: {sell_order['dealSize']} at {current_price} USDT "
-                            f"(Fee: {sell_order['fee']} USDT, Profit: {profit} USDT)"
-                        )
-                        del self.bot.active_trades[trade['orderId']]
+                if sell_order:
+                    profit = self.bot.calculate_profit(trade, sell_order)
+                    self.bot.update_profit(symbol, profit)
+                    logger.info("Sell order executed for %s: %s at %s USDT (Fee: %s USDT, Profit: %s USDT)",
+                                symbol, sell_order['dealSize'], current_price, sell_order['fee'], profit)
+                    del self.bot.active_trades[order_id]
         
         except Exception as e:
-            logger.error(f"Error checking sell condition for {symbol}: {e}")
+            logger.error("Error checking sell conditions: %s", e)
 
     @handle_trading_errors
     def update_bot_status(self, current_prices: Dict[str, float]) -> None:
@@ -108,16 +99,16 @@ class TradingLoop:
             if 'trade_messages' in st.session_state:
                 for symbol, profit in current_status['profits'].items():
                     if profit > 0:
-                        st.session_state.trade_messages.append(
-                            f"Profit for {symbol}: {profit:.8f} USDT"
-                        )
+                        st.session_state.trade_messages.append("Profit for %s: %.8f USDT" % (symbol, profit))
                 
                 st.session_state.trade_messages = st.session_state.trade_messages[-10:]
 
             self.bot.update_allocations(self.chosen_symbols)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Price cache stats: %s", config_manager.get_price_cache_stats())
             
         except Exception as e:
-            logger.error(f"Error updating bot status: {e}")
+            logger.error("Error updating bot status: %s", e)
 
 def initialize_trading_loop(bot: TradingBot, chosen_symbols: List[str]) -> Tuple[threading.Event, threading.Thread]:
     stop_event = threading.Event()
@@ -131,9 +122,8 @@ def initialize_trading_loop(bot: TradingBot, chosen_symbols: List[str]) -> Tuple
 
 def stop_trading_loop(stop_event: threading.Event, trading_thread: threading.Thread) -> None:
     stop_event.set()
-    try:
-        trading_thread.join(timeout=10)
-    except TimeoutError:
+    trading_thread.join(timeout=10)
+    if trading_thread.is_alive():
         logger.warning("Trading thread did not stop within the timeout period")
     else:
         logger.info("Trading loop stopped successfully")
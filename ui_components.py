@@ -14,14 +14,14 @@ class SidebarControls(UIComponent):
     def display(self) -> Tuple[bool, Optional[float], float, float, int]:
         logger.info("Displaying sidebar controls.")
         st.sidebar.header("Configuration")
-        is_simulation = st.sidebar.checkbox("Simulation Mode", value=config_manager.get_config('simulation_mode')['enabled'], key='is_simulation')
+        is_simulation = st.sidebar.checkbox("Simulation Mode", value=config_manager.simulation_mode.enabled, key='is_simulation')
         if is_simulation:
             logger.info("Simulation mode selected.")
             st.sidebar.write("Running in simulation mode. No real trades will be executed.")
             simulated_usdt_balance = st.sidebar.number_input(
                 "Simulated USDT Balance",
                 min_value=0.0,
-                value=config_manager.get_config('simulation_mode')['initial_balance'],
+                value=config_manager.simulation_mode.initial_balance,
                 step=0.1,
                 key='simulated_usdt_balance'
             )
@@ -154,7 +154,7 @@ class TradeMessages(UIComponent):
 class ErrorMessage(UIComponent):
     def display(self, error_message: str, container) -> None:
         if error_message:
-            logger.error(f"Displaying error message: {error_message}")
+            logger.error("Displaying error message: %s", error_message)
             container.error(error_message)
 
 class TradingControls(UIComponent):
@@ -168,6 +168,9 @@ class TradingControls(UIComponent):
 class SymbolSelector(UIComponent):
     def display(self, available_symbols: List[str], default_symbols: List[str]) -> List[str]:
         logger.info("Displaying symbol selector.")
+        if st.sidebar.button("Refresh Symbol List", key='refresh_symbols'):
+            # Picks up pairs KuCoin listed since the cached list was fetched, without waiting out its TTL
+            available_symbols = config_manager.refresh_trading_symbols()
         return st.sidebar.multiselect("Select Symbols to Trade", available_symbols, default=default_symbols, key='selected_symbols')
 
 class ChartDisplay(UIComponent):
@@ -179,7 +182,7 @@ class ChartDisplay(UIComponent):
 
 class SimulationIndicator(UIComponent):
     def display(self, is_simulation: bool) -> None:
-        logger.info(f"Displaying simulation indicator: {is_simulation}")
+        logger.debug("Displaying simulation indicator: %s", is_simulation)
         if is_simulation:
             st.sidebar.warning("Running in Simulation Mode")
         else:
@@ -201,8 +204,8 @@ class UIManager:
 
     def display_component(self, component_name: str, *args, **kwargs):
         if component_name in self.components:
-            logger.info(f"Displaying component: {component_name}")
+            logger.debug("Displaying component: %s", component_name)
             return self.components[component_name].display(*args, **kwargs)
         else:
-            logger.error(f"Component '{component_name}' not found")
+            logger.error("Component '%s' not found", component_name)
             st.error(f"UI component '{component_name}' not found")
@@ -1,8 +1,13 @@
 import logging
-from typing import Any, Callable
-from kucoin.client import Trade
-import time
-import uuid
+import threading
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+import numpy as np
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from kucoin.client import Market, Trade, User
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +16,7 @@ def handle_errors(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"An error occurred in {func.__name__}: {str(e)}")
+            logger.error("An error occurred in %s: %s", func.__name__, e)
             raise
     return wrapper
 
@@ -20,185 +25,129 @@ def handle_trading_errors(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"An error occurred in {func.__name__}: {str(e)}")
+            logger.error("An error occurred in %s: %s", func.__name__, e)
     return wrapper
 
+class PriceRingBuffer:
+    """Fixed-capacity (timestamp, price) history backed by NumPy arrays.
+
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the live
+    window is always one contiguous slice and ``snapshot`` can return views
+    instead of reordering or copying. Views are only safe on the writer's own
+    thread; readers on other threads ask for ``copy=True``.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._timestamps = np.empty(2 * capacity, dtype='datetime64[ns]')
+        self._prices = np.empty(2 * capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: datetime, price: float) -> None:
+        with self._lock:
+            head = self._head
+            self._timestamps[head] = self._timestamps[head + self.capacity] = timestamp
+            self._prices[head] = self._prices[head + self.capacity] = price
+            self._head = (head + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+    def snapshot(self, copy: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        if copy:
+            # Once the buffer is full the next append overwrites the oldest slot of a live view
+            with self._lock:
+                timestamps, prices = self._window()
+                return timestamps.copy(), prices.copy()
+        return self._window()
+
+    def _window(self) -> Tuple[np.ndarray, np.ndarray]:
+        start = (self._head - self._size) % self.capacity
+        end = start + self._size
+        return self._timestamps[start:end], self._prices[start:end]
+
+    def prices(self) -> np.ndarray:
+        return self.snapshot()[1]
+
 class KucoinClientManager:
+    __slots__ = ('_clients', '_credentials', 'session')
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
+        # Double-checked so concurrent reruns can't each build a manager (and a connection pool)
         if cls._instance is None:
-            cls._instance = super(KucoinClientManager, cls).__new__(cls)
-            cls._instance.client = None
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(KucoinClientManager, cls).__new__(cls)
+                    instance._clients = {}
+                    instance._credentials = None
+                    instance.session = None
+                    cls._instance = instance
         return cls._instance
 
+    @staticmethod
+    def create_session() -> requests.Session:
+        session = requests.Session()
+        # Retries only cover idempotent methods, so order placement (POST) is never resent
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504)))
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive', 'Keep-Alive': 'timeout=75, max=1000'})
+        session.hooks['response'].append(KucoinClientManager.use_orjson)
+        return session
+
+    @staticmethod
+    def use_orjson(response: requests.Response, *args, **kwargs) -> requests.Response:
+        # The SDK decodes every body with response.json(); orjson parses the raw bytes without a text decode.
+        # orjson's decode error subclasses ValueError, which is what the SDK catches.
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
     def initialize(self, key: str, secret: str, passphrase: str) -> None:
+        if self._clients:
+            return
+        with self._lock:
+            if not self._clients:
+                self._initialize(key, secret, passphrase)
+
+    def _initialize(self, key: str, secret: str, passphrase: str) -> None:
         try:
             logger.info("Initializing KuCoin client")
-            self.client = Trade(
-                key=key,
-                secret=secret,
-                passphrase=passphrase
-            )
+            if self.session is None:
+                self.session = self.create_session()
+            # Public market data needs no key material; Trade and User are built on first use
+            market_client = Market()
+            market_client.session = self.session
             # Test connection
-            self.client.get_timestamp()
+            market_client.get_server_timestamp()
+            self._credentials = (key, secret, passphrase)
+            self._clients = {Market: market_client}
             logger.info("KuCoin client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize KuCoin client: {e}")
+            logger.error("Failed to initialize KuCoin client: %s", e)
             raise
 
-    def get_client(self) -> Trade:
-        return self.client
-
-class SimulatedTradeClient:
-    def __init__(self, fees: dict, max_total_orders: int, currency_allocations: dict):
-        self.orders = {}
-        self.MAKER_FEE = fees.get('maker', 0.001)  # Default 0.1%
-        self.TAKER_FEE = fees.get('taker', 0.001)  # Default 0.1%
-        self.max_total_orders = max_total_orders
-        self.currency_allocations = currency_allocations
-
-    def create_limit_order(self, symbol: str, side: str, price: str, size: str, **kwargs):
-        if len(self.orders) >= self.max_total_orders:
-            logger.warning(f"Maximum total orders ({self.max_total_orders}) reached")
-            return {}
-
-        order_id = str(uuid.uuid4())
-        timestamp = int(time.time() * 1000)
-        price = float(price)
-        size = float(size)
-        
-        if side == Trade.SIDE_BUY:
-            # Calculate initial USDT amount
-            amount_usdt = size * price
-            # Calculate fee in USDT
-            fee_usdt = amount_usdt * self.TAKER_FEE
-            # Calculate actual crypto amount received after fees
-            actual_crypto_amount = (amount_usdt - fee_usdt) / price
-            
-            order = {
-                'orderId': order_id,
-                'symbol': symbol,
-                'opType': 'DEAL',
-                'type': Trade.ORDER_LIMIT,
-                'side': side,
-                'price': str(price),
-                'size': str(actual_crypto_amount),
-                'funds': str(amount_usdt),
-                'dealFunds': str(amount_usdt),
-                'dealSize': str(actual_crypto_amount),
-                'fee': str(fee_usdt),
-                'feeCurrency': symbol.split('-')[1],
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'status': 'done',
-                'timeInForce': kwargs.get('timeInForce', Trade.TIMEINFORCE_GOOD_TILL_CANCELLED),
-                'postOnly': kwargs.get('postOnly', False),
-                'hidden': kwargs.get('hidden', False),
-                'iceberg': kwargs.get('iceberg', False),
-                'visibleSize': kwargs.get('visibleSize', '0'),
-                'cancelAfter': kwargs.get('cancelAfter', 0),
-                'channel': 'API',
-                'clientOid': kwargs.get('clientOid', f'simulated_{side}_{symbol}_{timestamp}'),
-                'remark': kwargs.get('remark', None),
-                'tags': kwargs.get('tags', None),
-                'isActive': True,
-                'cancelExist': False,
-                'tradeType': 'TRADE'
-            }
-            
-            logger.info(f"Created simulated buy order: {actual_crypto_amount:.8f} {symbol} "
-                       f"at {price:.4f} USDT (Fee: {fee_usdt:.8f} USDT)")
-            
-        else:  # sell
-            amount_crypto = size
-            amount_usdt = amount_crypto * price
-            fee_usdt = amount_usdt * self.TAKER_FEE
-            actual_usdt_received = amount_usdt - fee_usdt
-            
-            order = {
-                'orderId': order_id,
-                'symbol': symbol,
-                'opType': 'DEAL',
-                'type': Trade.ORDER_LIMIT,
-                'side': side,
-                'price': str(price),
-                'size': str(amount_crypto),
-                'funds': str(actual_usdt_received),
-                'dealFunds': str(amount_usdt),
-                'dealSize': str(amount_crypto),
-                'fee': str(fee_usdt),
-                'feeCurrency': symbol.split('-')[1],
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'status': 'done',
-                'timeInForce': kwargs.get('timeInForce', Trade.TIMEINFORCE_GOOD_TILL_CANCELLED),
-                'postOnly': kwargs.get('postOnly', False),
-                'hidden': kwargs.get('hidden', False),
-                'iceberg': kwargs.get('iceberg', False),
-                'visibleSize': kwargs.get('visibleSize', '0'),
-                'cancelAfter': kwargs.get('cancelAfter', 0),
-                'channel': 'API',
-                'clientOid': kwargs.get('clientOid', f'simulated_{side}_{symbol}_{timestamp}'),
-                'remark': kwargs.get('remark', None),
-                'tags': kwargs.get('tags', None),
-                'isActive': True,
-                'cancelExist': False,
-                'tradeType': 'TRADE'
-            }
-            
-            logger.info(f"Created simulated sell order: {amount_crypto:.8f} {symbol} "
-                       f"at {price:.4f} USDT (Fee: {fee_usdt:.8f} USDT)")
-        
-        self.orders[order_id] = order
-        return {'orderId': order_id}
-    
-    def get_order(self, order_id: str):
-        return self.orders.get(order_id, {})
-
-    def cancel_order(self, order_id: str):
-        if order_id in self.orders:
-            self.orders[order_id]['status'] = 'cancelled'
-            self.orders[order_id]['isActive'] = False
-            logger.info(f"Cancelled order: {order_id}")
-            return {'cancelledOrderIds': [order_id]}
-        return {'cancelledOrderIds': []}
-
-    def get_fills(self, trade_type: str = 'TRADE', order_id: str = None):
-        fills = []
-        for order in self.orders.values():
-            if order['status'] == 'done':
-                if order_id is None or order['orderId'] == order_id:
-                    fills.append({
-                        'symbol': order['symbol'],
-                        'tradeId': str(uuid.uuid4()),
-                        'orderId': order['orderId'],
-                        'counterOrderId': str(uuid.uuid4()),
-                        'side': order['side'],
-                        'liquidity': 'taker',
-                        'forceTaker': True,
-                        'price': order['price'],
-                        'size': order['dealSize'],
-                        'funds': order['dealFunds'],
-                        'fee': order['fee'],
-                        'feeRate': str(self.TAKER_FEE),
-                        'feeCurrency': order['feeCurrency'],
-                        'stop': '',
-                        'type': 'limit',
-                        'createdAt': order['createdAt'],
-                        'tradeType': 'TRADE'
-                    })
-        return fills
-
-    def get_orders(self, symbol: str = None, status: str = None):
-        orders = []
-        for order in self.orders.values():
-            if (symbol is None or order['symbol'] == symbol) and \
-               (status is None or 
-                (status == 'active' and order['isActive']) or 
-                (status == 'done' and not order['isActive'])):
-                orders.append(order)
-        return orders
-    
-def create_simulated_trade_client(fees: dict, max_total_orders: int, currency_allocations: dict) -> SimulatedTradeClient:
-    return SimulatedTradeClient(fees, max_total_orders, currency_allocations)
+    def get_client(self, client_type: type = Trade) -> Optional[Any]:
+        if not self._clients:
+            return None
+        client = self._clients.get(client_type)
+        if client is None:
+            client = self._create_signed_client(client_type)
+        return client
+
+    def _create_signed_client(self, client_type: type) -> Any:
+        if client_type not in (Trade, User):
+            raise ValueError(f"Unsupported KuCoin client type: {client_type!r}")
+        with self._lock:
+            client = self._clients.get(client_type)
+            if client is None:
+                key, secret, passphrase = self._credentials
+                client = client_type(key=key, secret=secret, passphrase=passphrase)
+                client.session = self.session
+                # Copy-on-write so get_client can read the dict without taking the lock
+                self._clients = {**self._clients, client_type: client}
+        return client
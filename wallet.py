@@ -33,7 +33,7 @@ class Currency:
             # For sell, we're sending the full amount
             self.balance['trading'] -= amount
         
-        logger.info(f"Recorded {trade_type}: {self.symbol} - Amount: {amount:.8f}, Price: {price:.4f}, Fee: {fee:.8f}")
+        logger.info("Recorded %s: %s - Amount: %.8f, Price: %.4f, Fee: %.8f", trade_type, self.symbol, amount, price, fee)
 
 class Account:
     def __init__(self, account_type: str):
@@ -44,7 +44,7 @@ class Account:
     def add_currency(self, symbol: str) -> None:
         if symbol not in self.currencies:
             self.currencies[symbol] = Currency(symbol)
-            logger.info(f"Added currency {symbol} to account {self.account_type}")
+            logger.info("Added currency %s to account %s", symbol, self.account_type)
 
     def get_balance(self, symbol: str, balance_type: str) -> float:
         if symbol in self.currencies:
@@ -55,16 +55,16 @@ class Account:
         if symbol not in self.currencies:
             self.add_currency(symbol)
         self.currencies[symbol].balance[balance_type] = new_balance
-        logger.info(f"Updated {balance_type} balance for {symbol} in account {self.account_type}: {new_balance:.8f}")
+        logger.debug("Updated %s balance for %s in account %s: %.8f", balance_type, symbol, self.account_type, new_balance)
 
     def update_currency_price(self, symbol: str, price: float) -> None:
         if symbol in self.currencies:
             self.currencies[symbol].update_price(price)
-            logger.info(f"Updated price for {symbol} in account {self.account_type}: {price:.8f}")
+            logger.debug("Updated price for %s in account %s: %.8f", symbol, self.account_type, price)
 
     def set_currency_allocations(self, allocations: Dict[str, float]) -> None:
         self.currency_allocations = allocations
-        logger.info(f"Updated currency allocations for account {self.account_type}: {allocations}")
+        logger.info("Updated currency allocations for account %s: %s", self.account_type, allocations)
 
     def get_available_balance(self, symbol: str) -> float:
         if symbol in self.currencies:
@@ -94,12 +94,12 @@ class Wallet:
             account = self.accounts[account_type]
             account.update_balance(currency, balance, balance_type)
         else:
-            logger.warning(f"Invalid account type: {account_type}")
+            logger.warning("Invalid account type: %s", account_type)
 
     def get_balance(self, account_type: str, currency: str, balance_type: str) -> float:
         if account_type in self.accounts:
             return self.accounts[account_type].get_balance(currency, balance_type)
-        logger.warning(f"No {balance_type} balance found for {currency} in {account_type} account")
+        logger.warning("No %s balance found for %s in %s account", balance_type, currency, account_type)
         return 0.0
 
     def update_currency_price(self, account_type: str, currency: str, price: float) -> None:
@@ -107,7 +107,7 @@ class Wallet:
             account = self.accounts[account_type]
             account.update_currency_price(currency, price)
         else:
-            logger.warning(f"Invalid account type: {account_type}")
+            logger.warning("Invalid account type: %s", account_type)
 
     def sync_with_exchange(self, account_type: str) -> None:
         if self.is_simulation:
@@ -132,7 +132,7 @@ class Wallet:
                     price = float(ticker['price'])
                     self.update_currency_price(account_type, currency, price)
                 except Exception as e:
-                    logger.error(f"Error getting price for {symbol}: {e}")
+                    logger.error("Error getting price for %s: %s", symbol, e)
 
             # Update account balances
             for account in accounts:
@@ -142,15 +142,15 @@ class Wallet:
                 self.update_account_balance(account_type, currency, available_balance, 'trading')
                 self.update_account_balance(account_type, currency, total_balance - available_balance, 'liquid')
                 
-            logger.info(f"Wallet synchronized with exchange for account type: {account_type}")
+            logger.info("Wallet synchronized with exchange for account type: %s", account_type)
         except Exception as e:
-            logger.error(f"Error synchronizing wallet: {e}")
+            logger.error("Error synchronizing wallet: %s", e)
 
     def update_profits(self, symbol: str, profit: float) -> None:
         if symbol not in self.profits:
             self.profits[symbol] = 0
         self.profits[symbol] += profit
-        logger.info(f"Updated profit for {symbol}: {self.profits[symbol]:.8f} USDT")
+        logger.info("Updated profit for %s: %.8f USDT", symbol, self.profits[symbol])
 
     def get_profits(self) -> Dict[str, float]:
         return self.profits